@@ -5,6 +5,7 @@ Usage:
     python scripts/run_pipeline.py
     python scripts/run_pipeline.py --settings path/to/settings.toml
     python scripts/run_pipeline.py --lang es pt  # run only specific languages
+    python scripts/run_pipeline.py --no-cache    # recompute all metric scores
 """
 
 import argparse
@@ -26,6 +27,11 @@ def parse_args():
         default="settings.toml",
         help="Path to settings TOML file (default: settings.toml)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute metric scores and tokenization instead of reusing cached ones",
+    )
     return parser.parse_args()
 
 
@@ -37,7 +43,7 @@ def main():
         sys.exit(1)
 
     print(f"Using settings: {settings_path}")
-    results = run_pipeline(str(settings_path))
+    results = run_pipeline(str(settings_path), use_cache=not args.no_cache)
 
     print("\n=== Correlation Summary by Resource Tier ===")
     print(results["tier_summary"].to_string(index=False))
@@ -8,8 +8,9 @@ Primary analysis:
 All results are returned as a DataFrame for easy export to CSV or LaTeX.
 """
 
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
@@ -24,24 +25,43 @@ RESOURCE_TIERS = {
 ACCURACY_ERRORS = {"mistranslation", "omission", "addition", "untranslated"}
 FLUENCY_ERRORS = {"grammar", "spelling", "punctuation", "register", "style"}
 
+ScoreArray = Union[list[float], np.ndarray]
 
-def _pearson(x: list[float], y: list[float]) -> tuple[float, float]:
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
     r, p = stats.pearsonr(x, y)
     return float(r), float(p)
 
 
-def _spearman(x: list[float], y: list[float]) -> tuple[float, float]:
+def _spearman(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
     r, p = stats.spearmanr(x, y)
     return float(r), float(p)
 
 
+def _corr_p_value(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Two-sided p-value of correlation r over n samples (t-test, n - 2 dof).
+
+    Matches the p-values of stats.pearsonr and stats.spearmanr.
+    """
+    r = np.asarray(r, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt((n - 2) / (1.0 - r**2))
+    return 2 * stats.t.sf(np.abs(t), n - 2)
+
+
 def correlate_metric_vs_human(
-    human_scores: list[float],
-    metric_scores: list[float],
+    human_scores: ScoreArray,
+    metric_scores: ScoreArray,
     metric_name: str,
     lang: str,
 ) -> dict:
-    """Compute Pearson and Spearman for one metric against human scores."""
+    """Compute Pearson and Spearman for one metric against human scores.
+
+    Scores may be lists or arrays; they are converted to float64 arrays once
+    and shared by both correlations.
+    """
+    human_scores = np.ascontiguousarray(human_scores, dtype=np.float64)
+    metric_scores = np.ascontiguousarray(metric_scores, dtype=np.float64)
     if len(human_scores) < 3:
         return {
             "lang": lang,
@@ -93,29 +113,61 @@ def run_correlation_analysis(
         for lang in langs
     }
 
-    rows = []
-    for lang, group in scores_df.groupby("lang"):
-        human = group[human_column].tolist()
-        for metric in metric_columns:
-            if metric not in group.columns:
-                continue
-            metric_vals = group[metric].tolist()
-            result = correlate_metric_vs_human(human, metric_vals, metric, str(lang))
-            result["resource_tier"] = lang_to_tier.get(str(lang), "unknown")
-            rows.append(result)
-
-    result_df = pd.DataFrame(rows, columns=[
+    result_columns = [
         "lang", "resource_tier", "metric", "n",
         "pearson_r", "pearson_p", "spearman_r", "spearman_p",
-    ])
-    return result_df.sort_values(["metric", "resource_tier", "lang"])
+    ]
+    metric_columns = [m for m in metric_columns if m in scores_df.columns]
+    if scores_df.empty or not metric_columns:
+        return pd.DataFrame(columns=result_columns)
+
+    if not isinstance(scores_df["lang"].dtype, pd.CategoricalDtype):
+        scores_df = scores_df.astype({"lang": "category"})
+
+    # One correlation matrix per language; keep the human-vs-metric row
+    value_columns = [human_column] + metric_columns
+    grouped = scores_df.groupby("lang", observed=True, sort=False)[value_columns]
+    n_per_lang = grouped.size()
+    langs = n_per_lang.index.astype(str).to_numpy()
+    tiers = np.array(
+        [lang_to_tier.get(lang, "unknown") for lang in langs], dtype=object
+    )
+    n_metrics = len(metric_columns)
+
+    # corr() drops pairs with a missing value, so n counts complete pairs per metric
+    has_human = scores_df[[human_column]].notna().to_numpy()
+    complete = scores_df[metric_columns].notna() & has_human
+    n_complete = complete.groupby(scores_df["lang"], observed=True, sort=False).sum()
+
+    # Build the long-form result column by column, one row per (lang, metric)
+    n = n_complete.reindex(n_per_lang.index).to_numpy(dtype=np.int64).ravel()
+    columns = {
+        "lang": pd.Categorical(np.repeat(langs, n_metrics)),
+        "resource_tier": pd.Categorical(np.repeat(tiers, n_metrics)),
+        "metric": np.tile(np.array(metric_columns, dtype=object), len(langs)),
+        "n": n,
+    }
+    # For Spearman, pandas ranks each column (the human scores included) once
+    # per language and reuses the ranks across all metric pairs when there are
+    # no NaNs, so the human ranks are not recomputed per metric.
+    for method in ("pearson", "spearman"):
+        corr = grouped.corr(method=method).xs(human_column, level=1)[metric_columns]
+        r = corr.reindex(n_per_lang.index).to_numpy(dtype=np.float64).ravel()
+        r = np.where(n < 3, np.nan, r)
+        columns[f"{method}_r"] = r
+        columns[f"{method}_p"] = _corr_p_value(r, n)
+
+    result_df = pd.DataFrame(columns)
+    return result_df[result_columns].sort_values(["metric", "resource_tier", "lang"])
 
 
 def summarize_by_tier(correlation_df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate per-language correlations to per-tier averages."""
+    # lang and resource_tier are categorical; only report tiers that occur
     return (
         correlation_df
-        .groupby(["metric", "resource_tier"])[["pearson_r", "spearman_r"]]
+        .groupby(["metric", "resource_tier"], observed=True)
+        [["pearson_r", "spearman_r"]]
         .mean()
         .reset_index()
         .sort_values(["metric", "resource_tier"])
@@ -3,5 +3,9 @@
 Each module exposes a single function:
     score(sources, hypotheses, references, lang) -> list[float]
 
+Text inputs may be any sequence of strings (lists or NumPy object arrays,
+e.g. DataFrame columns via .to_numpy()); conversion to lists happens only
+where a backing library requires it.
+
 All scores are in [0, 1] or otherwise higher-is-better unless noted.
 """
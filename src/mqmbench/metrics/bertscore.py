@@ -2,20 +2,85 @@
 
 Uses microsoft/mdeberta-v3-base by default for multilingual coverage.
 F1 scores are returned (range roughly [0, 1], higher is better).
+
+Pairs are scored in length buckets whose batch size follows a padded-token
+budget, so short segments run in larger batches than long ones. All pairs
+sharing a reference go in the same bucket, keeping bert_score's per-call
+sentence deduplication for references repeated across systems.
 """
 
-from typing import Optional
+from typing import Iterator, Optional, Sequence
 
 import bert_score
+import numpy as np
+from transformers import AutoTokenizer
+
+# Longest encoder input; batch_size is interpreted as the batch size at this length
+MAX_SEQ_LEN = 512
+# Fewest pairs per bucket (except the last); also raises a batch_size below it
+MIN_BUCKET_SIZE = 8
+
+
+def token_lengths(sentences: Sequence[str], model_type: str) -> list[int]:
+    """Subword token counts (no special tokens) under model_type's fast tokenizer."""
+    tokenizer = AutoTokenizer.from_pretrained(model_type, use_fast=True)
+    encoded = tokenizer(list(sentences), add_special_tokens=False, return_length=True)
+    return encoded["length"]
+
+
+def _reference_groups(
+    references: Sequence[str], lengths: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group pairs by reference text.
+
+    Returns each pair's group id, each group's size and each group's length
+    (the longest pair in the group).
+    """
+    group_ids_by_ref: dict[str, int] = {}
+    group_ids = np.fromiter(
+        (group_ids_by_ref.setdefault(ref, len(group_ids_by_ref)) for ref in references),
+        dtype=np.int64,
+        count=len(references),
+    )
+    group_sizes = np.bincount(group_ids)
+    group_lens = np.zeros(len(group_sizes), dtype=np.int64)
+    np.maximum.at(group_lens, group_ids, lengths)
+    return group_ids, group_sizes, group_lens
+
+
+def _length_buckets(
+    sorted_lengths: np.ndarray, sizes: np.ndarray, max_tokens: int
+) -> Iterator[slice]:
+    """Split groups with ascending lengths into buckets of at most max_tokens.
+
+    Groups are never split; the returned slices index the groups' pairs laid
+    out back to back (sizes[i] pairs for group i).
+    """
+    bounds = np.concatenate(([0], np.cumsum(sizes)))
+    n = len(sorted_lengths)
+    start = 0
+    while start < n:
+        end = start + 1
+        while end < n:
+            padded_tokens = (bounds[end + 1] - bounds[start]) * sorted_lengths[end]
+            if padded_tokens > max_tokens:
+                break
+            end += 1
+        while end < n and bounds[end] - bounds[start] < MIN_BUCKET_SIZE:
+            end += 1
+        yield slice(int(bounds[start]), int(bounds[end]))
+        start = end
 
 
 def score(
-    sources: list[str],
-    hypotheses: list[str],
-    references: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
     lang: Optional[str] = None,
     model_type: str = "microsoft/mdeberta-v3-base",
     batch_size: int = 32,
+    hyp_lens: Optional[Sequence[int]] = None,
+    ref_lens: Optional[Sequence[int]] = None,
 ) -> list[float]:
     """Compute BERTScore F1 for each hypothesis/reference pair.
 
@@ -25,17 +90,49 @@ def score(
         references: Human reference sentences.
         lang: BCP-47 language code — passed to bert_score if model_type is None.
         model_type: HuggingFace model ID. If provided, overrides lang-based selection.
-        batch_size: Batch size for encoding.
+        batch_size: Batch size for full-length (512-token) inputs; buckets of
+            shorter pairs are made proportionally larger. Values below
+            MIN_BUCKET_SIZE behave as MIN_BUCKET_SIZE.
+        hyp_lens: Precomputed token_lengths() of hypotheses, to skip re-tokenizing.
+        ref_lens: Precomputed token_lengths() of references, to skip re-tokenizing.
 
     Returns:
         List of BERTScore F1 values in approximately [0, 1].
     """
-    _, _, f1 = bert_score.score(
-        hypotheses,
-        references,
+    if len(hypotheses) == 0:
+        return []
+
+    scorer = bert_score.BERTScorer(
         model_type=model_type,
         lang=None if model_type else lang,
         batch_size=batch_size,
-        verbose=False,
     )
-    return f1.tolist()
+    if hyp_lens is None:
+        hyp_lens = token_lengths(hypotheses, scorer.model_type)
+    if ref_lens is None:
+        ref_lens = token_lengths(references, scorer.model_type)
+    lengths = np.minimum(np.maximum(hyp_lens, ref_lens), MAX_SEQ_LEN)
+
+    group_ids, group_sizes, group_lens = _reference_groups(references, lengths)
+    group_order = np.argsort(group_lens, kind="stable")
+    group_rank = np.empty_like(group_order)
+    group_rank[group_order] = np.arange(len(group_order))
+    order = np.argsort(group_rank[group_ids], kind="stable")
+    hyps_sorted = [hypotheses[i] for i in order]
+    refs_sorted = [references[i] for i in order]
+
+    f1_sorted = np.empty(len(order), dtype=np.float64)
+    buckets = _length_buckets(
+        group_lens[group_order], group_sizes[group_order], batch_size * MAX_SEQ_LEN
+    )
+    for bucket in buckets:
+        _, _, f1 = scorer.score(
+            hyps_sorted[bucket],
+            refs_sorted[bucket],
+            batch_size=bucket.stop - bucket.start,
+        )
+        f1_sorted[bucket] = f1.numpy()
+
+    f1_out = np.empty_like(f1_sorted)
+    f1_out[order] = f1_sorted
+    return f1_out.tolist()
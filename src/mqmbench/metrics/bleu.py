@@ -1,20 +1,77 @@
 """BLEU score via sacrebleu.
 
-Returns corpus-level BLEU decomposed to sentence-level using sacrebleu's
-sentence_bleu, which applies add-1 smoothing by default.
+Sentence-level BLEU matching sacrebleu's sentence_bleu (13a tokenization,
+exponential smoothing, effective order). Match statistics for every segment
+are collected into arrays in one pass and the score is computed for all
+segments at once instead of calling sentence_bleu per pair.
 Score range: [0, 1] (higher is better).
 """
 
-from typing import Optional
+from collections import Counter
+from typing import Optional, Sequence
 
-import sacrebleu
+import numpy as np
+from sacrebleu.tokenizers.tokenizer_13a import Tokenizer13a
+
+MAX_NGRAM_ORDER = 4
+
+
+def tokenize(sentences: Sequence[str]) -> list[list[str]]:
+    """Split sentences into 13a tokens exactly as sacrebleu's BLEU does."""
+    tokenizer = Tokenizer13a()
+    return [tokenizer(sent.rstrip()).split() for sent in sentences]
+
+
+def _ngrams(tokens: list[str], n: int) -> Counter:
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def _bleu_from_stats(
+    correct: np.ndarray,
+    total: np.ndarray,
+    hyp_lens: np.ndarray,
+    ref_lens: np.ndarray,
+) -> np.ndarray:
+    """Vectorized sacrebleu BLEU with 'exp' smoothing and effective order.
+
+    Args:
+        correct: (N, MAX_NGRAM_ORDER) matched n-gram counts.
+        total: (N, MAX_NGRAM_ORDER) hypothesis n-gram counts.
+        hyp_lens: (N,) hypothesis token counts.
+        ref_lens: (N,) reference token counts.
+
+    Returns:
+        (N,) array of BLEU scores in [0, 1].
+    """
+    has_order = total > 0
+    eff_order = has_order.sum(axis=1)
+
+    # Each order with no matches halves the smoothed precision again (mteval-v13a)
+    smooth = np.exp2(np.cumsum((correct == 0) & has_order, axis=1))
+    safe_total = np.maximum(total, 1)
+    precisions = np.where(
+        correct > 0, correct / safe_total, 1.0 / (smooth * safe_total)
+    )
+    log_prec = np.where(has_order, np.log(precisions), 0.0)
+    geo_mean = np.exp(log_prec.sum(axis=1) / np.maximum(eff_order, 1))
+
+    with np.errstate(divide="ignore"):
+        bp = np.where(
+            hyp_lens < ref_lens,
+            np.exp(1.0 - ref_lens / np.maximum(hyp_lens, 1)) * (hyp_lens > 0),
+            1.0,
+        )
+
+    return np.where(correct.sum(axis=1) > 0, bp * geo_mean, 0.0)
 
 
 def score(
-    sources: list[str],
-    hypotheses: list[str],
-    references: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
     lang: Optional[str] = None,
+    hyp_tok: Optional[list[list[str]]] = None,
+    ref_tok: Optional[list[list[str]]] = None,
 ) -> list[float]:
     """Compute sentence-level BLEU for each hypothesis/reference pair.
 
@@ -23,12 +80,25 @@ def score(
         hypotheses: MT output sentences.
         references: Human reference sentences.
         lang: Target language code (unused, kept for uniform interface).
+        hyp_tok: Hypotheses already split by tokenize(), to skip re-tokenizing.
+        ref_tok: References already split by tokenize(), to skip re-tokenizing.
 
     Returns:
         List of BLEU scores in [0, 100] divided by 100 → [0, 1].
     """
-    scores = []
-    for hyp, ref in zip(hypotheses, references):
-        result = sacrebleu.sentence_bleu(hyp, [ref])
-        scores.append(result.score / 100.0)
-    return scores
+    hyp_toks = hyp_tok if hyp_tok is not None else tokenize(hypotheses)
+    ref_toks = ref_tok if ref_tok is not None else tokenize(references)
+
+    n_segments = len(hyp_toks)
+    correct = np.zeros((n_segments, MAX_NGRAM_ORDER), dtype=np.int64)
+    total = np.zeros((n_segments, MAX_NGRAM_ORDER), dtype=np.int64)
+    hyp_lens = np.fromiter((len(t) for t in hyp_toks), dtype=np.int64, count=n_segments)
+    ref_lens = np.fromiter((len(t) for t in ref_toks), dtype=np.int64, count=n_segments)
+
+    for i, (hyp_words, ref_words) in enumerate(zip(hyp_toks, ref_toks)):
+        for n in range(1, MAX_NGRAM_ORDER + 1):
+            hyp_ngrams = _ngrams(hyp_words, n)
+            correct[i, n - 1] = sum((hyp_ngrams & _ngrams(ref_words, n)).values())
+            total[i, n - 1] = max(len(hyp_words) - n + 1, 0)
+
+    return _bleu_from_stats(correct, total, hyp_lens, ref_lens).tolist()
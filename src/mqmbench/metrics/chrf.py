@@ -1,18 +1,165 @@
-"""ChrF++ score via sacrebleu.
+"""ChrF++ score, matching sacrebleu's CHRF(word_order=2).
 
 ChrF++ is character n-gram F-score with word n-grams (word_order=2).
+N-gram counts are extracted once per sentence and the F-scores for all
+segments are computed together from (N, orders) match statistics.
+When numba is installed, character n-gram matching runs in a compiled loop
+over packed code-point keys; otherwise Python Counters are used.
 Score range: [0, 100] → normalized to [0, 1] here.
 """
 
-from typing import Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Optional, Sequence
 
-import sacrebleu
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional (pip install -e ".[fast]"); Counters are used instead
+    njit = None
+
+CHAR_ORDER = 6
+WORD_ORDER = 2
+BETA = 2
+
+# Same punctuation set sacrebleu's chrF uses to split words
+_PUNCTS = set("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~")
+
+
+def _ngrams(seq, n: int) -> Counter:
+    return Counter(seq[i : i + n] for i in range(len(seq) - n + 1))
+
+
+def _split_punctuation(sent: str) -> tuple[str, ...]:
+    words = []
+    for w in sent.split():
+        if len(w) == 1:
+            words.append(w)
+        elif w[-1] in _PUNCTS:
+            words += [w[:-1], w[-1]]
+        elif w[0] in _PUNCTS:
+            words += [w[0], w[1:]]
+        else:
+            words.append(w)
+    return tuple(words)
+
+
+@lru_cache(maxsize=8192)
+def _char_ngrams(sent: str) -> tuple[Counter, ...]:
+    """Character 1..6-grams with whitespace removed.
+
+    Cached on the sentence text so repeated references/hypotheses across
+    systems are only counted once. The returned Counters must not be mutated.
+    """
+    chars = "".join(sent.split())
+    return tuple(_ngrams(chars, n) for n in range(1, CHAR_ORDER + 1))
+
+
+@lru_cache(maxsize=8192)
+def _word_ngrams(sent: str) -> tuple[Counter, ...]:
+    """Word 1..2-grams after splitting off edge punctuation (cached as above)."""
+    words = _split_punctuation(sent)
+    return tuple(_ngrams(words, n) for n in range(1, WORD_ORDER + 1))
+
+
+def _window_keys(ids: np.ndarray, n: int, bits: int) -> np.ndarray:
+    """Pack every length-n window of ids into one int64 key (bits per id)."""
+    n_windows = max(ids.shape[0] - n + 1, 0)
+    keys = np.zeros(n_windows, dtype=np.int64)
+    for i in range(n_windows):
+        key = 0
+        for j in range(n):
+            key = (key << bits) | ids[i + j]
+        keys[i] = key
+    return keys
+
+
+def _sorted_overlap(a: np.ndarray, b: np.ndarray) -> int:
+    """Size of the multiset intersection of two sorted arrays."""
+    i = j = overlap = 0
+    while i < a.shape[0] and j < b.shape[0]:
+        if a[i] == b[j]:
+            overlap += 1
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return overlap
+
+
+def _char_match_stats(codes, offsets, n_hyp, n_ref, n_match, done):
+    """Fill character-order hyp/ref/match counts for every (hyp, ref) pair.
+
+    codes holds the code points of hyp_0, ref_0, hyp_1, ref_1, ... back to back,
+    delimited by offsets. Each pair's alphabet is renumbered densely so an
+    n-gram packs exactly into one int64 key (no hashing, no collisions); pairs
+    with too many distinct characters to pack are left with done=False.
+    """
+    for p in range(done.shape[0]):
+        hyp = codes[offsets[2 * p] : offsets[2 * p + 1]]
+        ref = codes[offsets[2 * p + 1] : offsets[2 * p + 2]]
+        alphabet = np.unique(np.concatenate((hyp, ref)))
+        bits = 1
+        while (1 << bits) < alphabet.shape[0]:
+            bits += 1
+        if bits * CHAR_ORDER > 63:
+            continue
+        hyp_ids = np.searchsorted(alphabet, hyp).astype(np.int64)
+        ref_ids = np.searchsorted(alphabet, ref).astype(np.int64)
+        for n in range(1, CHAR_ORDER + 1):
+            hyp_keys = np.sort(_window_keys(hyp_ids, n, bits))
+            ref_keys = np.sort(_window_keys(ref_ids, n, bits))
+            n_hyp[p, n - 1] = hyp_keys.shape[0]
+            n_ref[p, n - 1] = ref_keys.shape[0]
+            n_match[p, n - 1] = _sorted_overlap(hyp_keys, ref_keys)
+        done[p] = True
+
+
+if njit is not None:
+    _window_keys = njit(cache=True)(_window_keys)
+    _sorted_overlap = njit(cache=True)(_sorted_overlap)
+    _char_match_stats = njit(cache=True)(_char_match_stats)
+
+
+def _fill_counter_stats(
+    i, offset, hyp_ngrams, ref_ngrams, n_hyp, n_ref, n_match
+) -> None:
+    for k, (h, r) in enumerate(zip(hyp_ngrams, ref_ngrams), start=offset):
+        n_hyp[i, k] = sum(h.values())
+        n_ref[i, k] = sum(r.values())
+        n_match[i, k] = sum((h & r).values())
+
+
+def _chrf_from_stats(
+    n_hyp: np.ndarray, n_ref: np.ndarray, n_match: np.ndarray, beta: int = BETA
+) -> np.ndarray:
+    """Vectorized sacrebleu chrF from (N, orders) hyp/ref/match n-gram counts.
+
+    Precision and recall are averaged over the orders present in both
+    hypothesis and reference, then combined into a single F-beta score.
+    """
+    effective = (n_hyp > 0) & (n_ref > 0)
+    eff_order = effective.sum(axis=1)
+    prec = np.where(effective, n_match / np.maximum(n_hyp, 1), 0.0).sum(axis=1)
+    rec = np.where(effective, n_match / np.maximum(n_ref, 1), 0.0).sum(axis=1)
+    prec /= np.maximum(eff_order, 1)
+    rec /= np.maximum(eff_order, 1)
+
+    factor = beta**2
+    denom = factor * prec + rec
+    return np.where(
+        prec + rec > 0, (1 + factor) * prec * rec / np.where(denom > 0, denom, 1.0), 0.0
+    )
 
 
 def score(
-    sources: list[str],
-    hypotheses: list[str],
-    references: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
     lang: Optional[str] = None,
 ) -> list[float]:
     """Compute sentence-level ChrF++ for each hypothesis/reference pair.
@@ -26,9 +173,30 @@ def score(
     Returns:
         List of ChrF++ scores in [0, 1].
     """
-    chrf = sacrebleu.CHRF(word_order=2)
-    scores = []
-    for hyp, ref in zip(hypotheses, references):
-        result = chrf.sentence_score(hyp, [ref])
-        scores.append(result.score / 100.0)
-    return scores
+    n_orders = CHAR_ORDER + WORD_ORDER
+    n_segments = len(hypotheses)
+    n_hyp = np.zeros((n_segments, n_orders), dtype=np.int64)
+    n_ref = np.zeros((n_segments, n_orders), dtype=np.int64)
+    n_match = np.zeros((n_segments, n_orders), dtype=np.int64)
+
+    done = np.zeros(n_segments, dtype=np.bool_)
+    if njit is not None and n_segments:
+        pairs = zip(hypotheses, references)
+        stripped = ["".join(sent.split()) for pair in pairs for sent in pair]
+        offsets = np.zeros(len(stripped) + 1, dtype=np.int64)
+        np.cumsum([len(sent) for sent in stripped], out=offsets[1:])
+        # surrogatepass: lone surrogates are kept as their code points, as in sacrebleu
+        text = "".join(stripped).encode("utf-32-le", "surrogatepass")
+        codes = np.frombuffer(text, dtype=np.uint32)
+        _char_match_stats(codes, offsets, n_hyp, n_ref, n_match, done)
+
+    for i, (hyp, ref) in enumerate(zip(hypotheses, references)):
+        if not done[i]:
+            _fill_counter_stats(
+                i, 0, _char_ngrams(hyp), _char_ngrams(ref), n_hyp, n_ref, n_match
+            )
+        _fill_counter_stats(
+            i, CHAR_ORDER, _word_ngrams(hyp), _word_ngrams(ref), n_hyp, n_ref, n_match
+        )
+
+    return _chrf_from_stats(n_hyp, n_ref, n_match).tolist()
@@ -4,24 +4,110 @@ COMET (wmt22-comet-da): reference-based, scores in approximately [0, 1].
 xCOMET (XCOMET-XL): also provides MQM-style error span detection.
 """
 
-from typing import Optional
+import functools
+import gc
+import os
+from typing import Optional, Sequence, Union
 
+import torch
 from comet import download_model, load_from_checkpoint
+from huggingface_hub.constants import HF_HUB_CACHE
 
 
+def _is_cached(model_name: str) -> bool:
+    """True if the model snapshot is already in the local HF hub cache."""
+    return os.path.isdir(
+        os.path.join(HF_HUB_CACHE, "models--" + model_name.replace("/", "--"))
+    )
+
+
+@functools.lru_cache(maxsize=2)
 def _load_model(model_name: str):
-    model_path = download_model(model_name)
-    return load_from_checkpoint(model_path)
+    # Skip the hub round-trips (checkpoint, encoder config/tokenizer) when the
+    # checkpoint is already on disk
+    local_files_only = _is_cached(model_name)
+    model_path = download_model(model_name, local_files_only=local_files_only)
+    return load_from_checkpoint(model_path, local_files_only=local_files_only)
+
+
+def release_models() -> None:
+    """Drop cached checkpoints and return their GPU memory to the allocator."""
+    _load_model.cache_clear()
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _half_precision_dtype() -> torch.dtype:
+    """bfloat16 on Ampere and newer, float16 on older GPUs (e.g. V100)."""
+    if torch.cuda.get_device_capability()[0] >= 8:
+        return torch.bfloat16
+    return torch.float16
+
+
+def _prepare_data(sources, hypotheses, references) -> tuple[list[dict], list[int]]:
+    """Build COMET input triples sorted by length, plus the order to undo the sort."""
+    data = [
+        {"src": src, "mt": hyp, "ref": ref}
+        for src, hyp, ref in zip(sources, hypotheses, references)
+    ]
+    # Sort by the longest field so each batch pads to similar lengths. COMET's
+    # own length_batching only looks at src and is disabled on multi-GPU runs.
+    lens = [max(len(d["src"]), len(d["mt"]), len(d["ref"])) for d in data]
+    order = sorted(range(len(data)), key=lens.__getitem__)
+    return [data[i] for i in order], order
+
+
+def _predict_sorted(
+    model,
+    sorted_data: list[dict],
+    order: list[int],
+    batch_size: int,
+    gpus: int,
+    half_precision: bool = False,
+) -> list[float]:
+    # Half precision is opt-in: under autocast the estimator head also runs in
+    # half precision, so scores are quantized (~0.004 steps in bf16) and tie
+    # more often. Weights stay in float32 either way, since the model is
+    # shared through the _load_model cache.
+    use_autocast = half_precision and gpus > 0
+    dtype = _half_precision_dtype() if use_autocast else torch.float16
+    with torch.autocast("cuda", dtype=dtype, enabled=use_autocast):
+        output = model.predict(
+            sorted_data,
+            batch_size=batch_size,
+            gpus=gpus,
+            length_batching=False,
+        )
+
+    scores = [0.0] * len(order)
+    for i, s in zip(order, output.scores):
+        scores[i] = s
+    return scores
+
+
+def _predict(
+    model,
+    sources,
+    hypotheses,
+    references,
+    batch_size: int,
+    gpus: int,
+    half_precision: bool = False,
+) -> list[float]:
+    sorted_data, order = _prepare_data(sources, hypotheses, references)
+    return _predict_sorted(model, sorted_data, order, batch_size, gpus, half_precision)
 
 
 def score(
-    sources: list[str],
-    hypotheses: list[str],
-    references: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
     lang: Optional[str] = None,
     model_name: str = "Unbabel/wmt22-comet-da",
-    batch_size: int = 16,
+    batch_size: int = 32,
     gpus: int = 0,
+    half_precision: bool = False,
 ) -> list[float]:
     """Compute COMET scores for each (source, hypothesis, reference) triple.
 
@@ -33,33 +119,70 @@ def score(
         model_name: COMET model to use.
         batch_size: Batch size.
         gpus: Number of GPUs (0 = CPU).
+        half_precision: Run the GPU forward pass under bf16/fp16 autocast.
+            Faster, but scores are quantized to half precision.
 
     Returns:
         List of COMET scores, approximately in [0, 1].
     """
     model = _load_model(model_name)
-    data = [
-        {"src": src, "mt": hyp, "ref": ref}
-        for src, hyp, ref in zip(sources, hypotheses, references)
-    ]
-    output = model.predict(data, batch_size=batch_size, gpus=gpus)
-    return output.scores
+    return _predict(
+        model, sources, hypotheses, references, batch_size, gpus, half_precision
+    )
 
 
 def score_xcomet(
-    sources: list[str],
-    hypotheses: list[str],
-    references: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
     lang: Optional[str] = None,
     model_name: str = "Unbabel/XCOMET-XL",
-    batch_size: int = 8,
+    batch_size: int = 16,
     gpus: int = 0,
+    half_precision: bool = False,
 ) -> list[float]:
     """Compute xCOMET scores (same interface as score(), separate function for model clarity)."""
-    return score(
-        sources, hypotheses, references,
-        lang=lang,
-        model_name=model_name,
-        batch_size=batch_size,
-        gpus=gpus,
+    model = _load_model(model_name)
+    return _predict(
+        model, sources, hypotheses, references, batch_size, gpus, half_precision
     )
+
+
+def score_many(
+    model_names: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
+    batch_size: Union[int, Sequence[int]] = 16,
+    gpus: Union[int, Sequence[int]] = 0,
+    half_precision: Union[bool, Sequence[bool]] = False,
+) -> dict[str, list[float]]:
+    """Score the same triples with several COMET models (e.g. COMET + xCOMET).
+
+    The input triples are built and length-sorted once and shared by every
+    model; checkpoints come from the same cache as score()/score_xcomet().
+
+    Args:
+        model_names: COMET model IDs to run.
+        sources: Source sentences.
+        hypotheses: MT output sentences.
+        references: Human reference sentences.
+        batch_size: One batch size for all models, or one per model name.
+        gpus: Number of GPUs (0 = CPU) for all models, or one per model name.
+        half_precision: Whether to autocast to bf16/fp16 on GPU (see score()),
+            for all models or one per model name.
+
+    Returns:
+        Dict mapping each model name to its list of scores.
+    """
+    if isinstance(batch_size, int):
+        batch_size = [batch_size] * len(model_names)
+    if isinstance(gpus, int):
+        gpus = [gpus] * len(model_names)
+    if isinstance(half_precision, bool):
+        half_precision = [half_precision] * len(model_names)
+    sorted_data, order = _prepare_data(sources, hypotheses, references)
+    return {
+        name: _predict_sorted(_load_model(name), sorted_data, order, bs, n_gpus, half)
+        for name, bs, n_gpus, half in zip(model_names, batch_size, gpus, half_precision)
+    }
@@ -11,9 +11,15 @@ suited for running on the BYU supercomputer with HF_HUB_OFFLINE=1.
 """
 
 import re
-from typing import Optional
+from typing import Optional, Sequence
 
-from transformers import pipeline as hf_pipeline
+import torch
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    BitsAndBytesConfig,
+    pipeline as hf_pipeline,
+)
 
 GEMBA_PROMPT_TEMPLATE = """You are evaluating a machine translation from {source_lang} to {target_lang}.
 
@@ -27,27 +33,60 @@ If there are no errors, write: NO ERRORS"""
 
 SEVERITY_PENALTIES = {"major": 5.0, "minor": 1.0}
 
+QUANT_MODES = ("nf4", "int8", "bf16", "fp16")
+
+
+def _load_model(model_name: str, quant: str):
+    """Load the LLM with NF4 / int8 bitsandbytes weights, or unquantized bf16 / fp16."""
+    if quant == "nf4":
+        quant_config = BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_compute_dtype=torch.bfloat16,
+            bnb_4bit_quant_type="nf4",
+        )
+        kwargs = {"quantization_config": quant_config}
+    elif quant == "int8":
+        kwargs = {"quantization_config": BitsAndBytesConfig(load_in_8bit=True)}
+    elif quant == "bf16":
+        kwargs = {"torch_dtype": torch.bfloat16}
+    elif quant == "fp16":
+        kwargs = {"torch_dtype": torch.float16}
+    else:
+        raise ValueError(
+            f"Unknown GEMBA quantization {quant!r}; expected one of {QUANT_MODES}"
+        )
+    return AutoModelForCausalLM.from_pretrained(model_name, device_map="auto", **kwargs)
+
+
+_NO_ERRORS = "NO ERRORS"
+_SEVERITY_RE = re.compile(r"severity:\s*(major|minor)", re.IGNORECASE)
+
 
 def _parse_gemba_output(text: str) -> float:
     """Parse LLM output and compute MQM penalty score."""
-    if "NO ERRORS" in text.upper():
+    if _NO_ERRORS in text.upper():
         return 0.0
-    penalty = 0.0
-    for match in re.finditer(r"severity:\s*(major|minor)", text, re.IGNORECASE):
-        sev = match.group(1).lower()
-        penalty += SEVERITY_PENALTIES.get(sev, 0.0)
-    return penalty
+    lowered = text.lower()
+    n_major = lowered.count("severity: major")
+    n_minor = lowered.count("severity: minor")
+    # Fall back to the regex when some severities use other spacing
+    if n_major + n_minor < lowered.count("severity:"):
+        severities = [sev.lower() for sev in _SEVERITY_RE.findall(text)]
+        n_major = severities.count("major")
+        n_minor = severities.count("minor")
+    return SEVERITY_PENALTIES["major"] * n_major + SEVERITY_PENALTIES["minor"] * n_minor
 
 
 def score(
-    sources: list[str],
-    hypotheses: list[str],
-    references: list[str],
+    sources: Sequence[str],
+    hypotheses: Sequence[str],
+    references: Sequence[str],
     lang: Optional[str] = None,
     model_name: str = "",
     source_lang: str = "English",
     target_lang: str = "the target language",
     batch_size: int = 4,
+    quant: str = "nf4",
 ) -> list[float]:
     """Compute GEMBA-MQM scores using a local LLM.
 
@@ -59,7 +98,9 @@ def score(
         model_name: HuggingFace model ID for the LLM.
         source_lang: Human-readable source language name for prompt.
         target_lang: Human-readable target language name for prompt.
-        batch_size: Number of prompts to process at once.
+        batch_size: Number of prompts generated together in one batch.
+        quant: Weight format for the LLM: "nf4" or "int8" (bitsandbytes),
+            or unquantized "bf16" / "fp16".
 
     Returns:
         List of MQM penalty scores (0 = perfect, higher = more errors).
@@ -77,10 +118,13 @@ def score(
 
     pipe = hf_pipeline(
         "text-generation",
-        model=model_name,
-        max_new_tokens=256,
-        do_sample=False,
+        model=_load_model(model_name, quant),
+        tokenizer=AutoTokenizer.from_pretrained(model_name),
     )
+    # Decoder-only models need left padding and a pad token for batched generation
+    pipe.tokenizer.padding_side = "left"
+    if pipe.tokenizer.pad_token_id is None:
+        pipe.tokenizer.pad_token_id = pipe.tokenizer.eos_token_id
 
     prompts = [
         GEMBA_PROMPT_TEMPLATE.format(
@@ -92,12 +136,19 @@ def score(
         for src, hyp in zip(sources, hypotheses)
     ]
 
-    penalties = []
-    for i in range(0, len(prompts), batch_size):
-        batch = prompts[i : i + batch_size]
-        outputs = pipe(batch)
-        for out in outputs:
-            generated = out[0]["generated_text"]
-            penalties.append(_parse_gemba_output(generated))
+    # Generate in length order so each batch pads to similar prompt lengths
+    order = sorted(range(len(prompts)), key=lambda i: len(prompts[i]))
+    outputs = pipe(
+        [prompts[i] for i in order],
+        batch_size=batch_size,
+        max_new_tokens=256,
+        do_sample=False,
+        use_cache=True,
+        return_full_text=False,
+        pad_token_id=pipe.tokenizer.pad_token_id,
+    )
 
+    penalties = [0.0] * len(prompts)
+    for i, out in zip(order, outputs):
+        penalties[i] = _parse_gemba_output(out[0]["generated_text"])
     return penalties
@@ -10,21 +10,32 @@ Steps:
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
+import joblib
+from joblib import Parallel, delayed, effective_n_jobs
 
 from mqmbench.analysis.correlation import run_correlation_analysis, summarize_by_tier
 from mqmbench.config import init_settings, settings
 from mqmbench.data.converter import annotations_to_sentence_scores
 from mqmbench.data.loader import load_all_annotations
 
+# Smallest shard worth shipping to a worker process for the CPU metrics
+MIN_SHARD_SIZE = 500
+CPU_METRIC_LABELS = {"bleu": "BLEU", "chrf": "ChrF++"}
+METRIC_ORDER = ["bleu", "chrf", "bertscore", "comet", "xcomet"]
 
-def run_pipeline(settings_file: Optional[str] = None) -> dict:
+
+def run_pipeline(settings_file: Optional[str] = None, use_cache: bool = True) -> dict:
     """Run the full benchmark pipeline.
 
     Args:
         settings_file: Path to settings.toml. If None, uses defaults.
+        use_cache: Reuse metric scores and tokenization cached in
+                   output_dir/cache/ from earlier runs on the same data and
+                   settings.
 
     Returns:
         Dict with keys 'correlations' (DataFrame) and 'tier_summary' (DataFrame).
@@ -41,10 +52,11 @@ def run_pipeline(settings_file: Optional[str] = None) -> dict:
     print(f"  Loaded {len(raw_df)} annotation rows across {raw_df['lang'].nunique()} languages.")
 
     print("Converting span-level annotations to sentence scores...")
-    scores_df = annotations_to_sentence_scores(raw_df)
+    scores_df = _compact_columns(annotations_to_sentence_scores(raw_df))
+    del raw_df  # span-level rows are no longer needed once segments are scored
     print(f"  {len(scores_df)} segments.")
 
-    metric_columns = _run_metrics(scores_df, settings)
+    metric_columns = _run_metrics(scores_df, settings, use_cache=use_cache)
 
     print("Running correlation analysis...")
     corr_df = run_correlation_analysis(scores_df, metric_columns)
@@ -59,61 +71,259 @@ def run_pipeline(settings_file: Optional[str] = None) -> dict:
     return {"correlations": corr_df, "tier_summary": tier_df}
 
 
-def _run_metrics(scores_df: pd.DataFrame, cfg) -> list[str]:
-    """Run each configured metric and add score columns to scores_df in place."""
+def _compact_columns(scores_df: pd.DataFrame) -> pd.DataFrame:
+    """Store segment text as Arrow strings and language codes as categories.
+
+    Arrow string arrays keep each column in one contiguous buffer instead of
+    one Python object per cell, and a categorical 'lang' makes the per-language
+    groupbys in the correlation analysis group on integer codes.
+    """
+    dtypes = {col: "string[pyarrow]" for col in ("source", "hypothesis", "reference")}
+    dtypes["lang"] = "category"
+    return scores_df.astype(
+        {col: dtype for col, dtype in dtypes.items() if col in scores_df}
+    )
+
+
+def prepare_tokenized(
+    hypotheses: np.ndarray,
+    references: np.ndarray,
+    cfg,
+    cache_dir: Path,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """Tokenize hypotheses and references once for the string metrics.
+
+    Produces 13a tokens (hyp_tok, ref_tok) for BLEU and BERTScore subword
+    lengths (hyp_len, ref_len) for its length bucketing, only for the metrics
+    that are enabled. Results are cached in cache_dir alongside the metric
+    scores, keyed on a hash of the hypothesis/reference text and the
+    tokenizer settings; use_cache=False recomputes them.
+
+    Args:
+        hypotheses: Hypothesis column, already materialized by the caller.
+        references: Reference column, already materialized by the caller.
+        cfg: Pipeline settings.
+        cache_dir: Directory for the cached token parquet.
+        use_cache: Reuse a cached tokenization of the same text and settings.
+
+    Returns:
+        DataFrame aligned row-for-row with hypotheses/references.
+    """
     metrics_to_run = list(cfg.metrics.run)
-    added_columns = []
+    # [metrics.bertscore] may be absent when BERTScore is not run
+    bertscore_cfg = getattr(cfg.metrics, "bertscore", None)
+    bertscore_model = getattr(bertscore_cfg, "model", "microsoft/mdeberta-v3-base")
+    use_bleu = "bleu" in metrics_to_run
+    use_bertscore = "bertscore" in metrics_to_run
+    tokenizers = {"bleu": use_bleu, "bertscore": use_bertscore and bertscore_model}
+    key = joblib.hash((hypotheses, references, tokenizers))
+    cache_path = cache_dir / f"tokens-{key}.parquet"
 
-    sources = scores_df["source"].tolist()
-    hyps = scores_df["hypothesis"].tolist()
-    refs = scores_df["reference"].tolist()
-    langs = scores_df["lang"].tolist()
+    if use_cache and cache_path.exists():
+        print(f"  Using cached tokenization from {cache_path}")
+        cached = pd.read_parquet(cache_path)
+        for col in ("hyp_tok", "ref_tok"):
+            if col in cached.columns:
+                cached[col] = cached[col].map(list)
+        return cached
 
-    if "bleu" in metrics_to_run:
-        print("Computing BLEU...")
+    tokens = pd.DataFrame(index=pd.RangeIndex(len(hypotheses)))
+    if use_bleu:
         from mqmbench.metrics import bleu
-        scores_df["bleu"] = bleu.score(sources, hyps, refs)
-        added_columns.append("bleu")
+        tokens["hyp_tok"] = bleu.tokenize(hypotheses)
+        tokens["ref_tok"] = bleu.tokenize(references)
+    if use_bertscore:
+        from mqmbench.metrics import bertscore
+        tokens["hyp_len"] = bertscore.token_lengths(hypotheses, bertscore_model)
+        tokens["ref_len"] = bertscore.token_lengths(references, bertscore_model)
+    tokens.to_parquet(cache_path, index=False)
+    return tokens
+
+
+def _score_parallel(
+    jobs: dict[str, tuple[Callable, dict]], n_jobs: int = -1
+) -> dict[str, list[float]]:
+    """Run CPU-bound segment-level metrics over contiguous shards in worker processes.
+
+    Args:
+        jobs: Metric name → (score function, keyword columns to shard), e.g.
+              {"bleu": (bleu.score, {"hypotheses": hyps, "references": refs})}.
+        n_jobs: Worker processes (-1 = all cores).
+
+    Returns:
+        Metric name → scores in the original segment order. Shards of all
+        metrics are submitted together so the metrics run concurrently; when
+        every metric fits in a single shard they run in this process instead.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    tasks, owners = [], []
+    for name, (score_fn, columns) in jobs.items():
+        n = len(columns["hypotheses"])
+        n_shards = max(1, min(n_jobs, n // MIN_SHARD_SIZE))
+        bounds = np.linspace(0, n, n_shards + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            shard = {col: values[start:stop] for col, values in columns.items()}
+            tasks.append(delayed(score_fn)(None, **shard))
+            owners.append(name)
 
-    if "chrf" in metrics_to_run:
-        print("Computing ChrF++...")
+    results = {name: [] for name in jobs}
+    if len(tasks) == len(jobs):
+        # One shard per metric: worker start-up would cost more than it saves
+        shard_results = [fn(*args, **kwargs) for fn, args, kwargs in tasks]
+    else:
+        shard_results = Parallel(n_jobs=n_jobs, backend="loky")(tasks)
+    for name, shard_scores in zip(owners, shard_results):
+        results[name].extend(shard_scores)
+    return results
+
+
+def _metric_config(cfg, metric: str):
+    """Settings that affect a metric's scores, used in its cache key."""
+    if metric == "gemba":
+        return {
+            "model": cfg.metrics.gemba_model,
+            "quant": getattr(cfg.metrics, "gemba_quant", "nf4"),
+        }
+    section = getattr(cfg.metrics, metric, None)
+    return section.to_dict() if hasattr(section, "to_dict") else section
+
+
+def _run_metrics(scores_df: pd.DataFrame, cfg, use_cache: bool = True) -> list[str]:
+    """Run each configured metric and add score columns to scores_df in place.
+
+    Score columns and tokenization are cached in output_dir/cache/, keyed on
+    a hash of the segment texts and the relevant settings; cached results
+    are not recomputed unless use_cache is False.
+    """
+    metrics_to_run = list(cfg.metrics.run)
+    enabled = [m for m in METRIC_ORDER if m in metrics_to_run]
+    if getattr(cfg.metrics, "run_gemba", False):
+        enabled.append("gemba")
+
+    # Materialize the Arrow text columns once (one Python str per cell) and
+    # share them with tokenization and every metric
+    sources = scores_df["source"].to_numpy()
+    hyps = scores_df["hypothesis"].to_numpy()
+    refs = scores_df["reference"].to_numpy()
+
+    cache_dir = Path(cfg.data.output_dir) / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    text_key = joblib.hash((sources, hyps, refs))
+    cache_paths = {
+        m: cache_dir / f"{m}-{joblib.hash((text_key, _metric_config(cfg, m)))}.parquet"
+        for m in enabled
+    }
+    results = {}
+    if use_cache:
+        for m, path in cache_paths.items():
+            if path.exists():
+                print(f"Using cached {m} scores from {path}")
+                results[m] = pd.read_parquet(path)[m].tolist()
+    pending = [m for m in enabled if m not in results]
+    computed = set(pending)
+
+    if "bleu" in pending or "bertscore" in pending:
+        print("Tokenizing hypotheses and references...")
+        tokens = prepare_tokenized(hyps, refs, cfg, cache_dir, use_cache=use_cache)
+
+    cpu_jobs = {}
+    if "bleu" in pending:
+        from mqmbench.metrics import bleu
+        cpu_jobs["bleu"] = (bleu.score, {
+            "hypotheses": hyps,
+            "references": refs,
+            "hyp_tok": tokens["hyp_tok"].tolist(),
+            "ref_tok": tokens["ref_tok"].tolist(),
+        })
+
+    if "chrf" in pending:
         from mqmbench.metrics import chrf
-        scores_df["chrf"] = chrf.score(sources, hyps, refs)
-        added_columns.append("chrf")
+        cpu_jobs["chrf"] = (chrf.score, {"hypotheses": hyps, "references": refs})
 
-    if "bertscore" in metrics_to_run:
+    if cpu_jobs:
+        labels = " + ".join(CPU_METRIC_LABELS[name] for name in cpu_jobs)
+        print(f"Computing {labels}...")
+        n_jobs = getattr(cfg.metrics, "n_jobs", -1)
+        results.update(_score_parallel(cpu_jobs, n_jobs))
+
+    if "bertscore" in pending:
         print("Computing BERTScore...")
         from mqmbench.metrics import bertscore
         model = getattr(cfg.metrics.bertscore, "model", "microsoft/mdeberta-v3-base")
         batch_size = getattr(cfg.metrics.bertscore, "batch_size", 32)
-        scores_df["bertscore"] = bertscore.score(sources, hyps, refs, model_type=model, batch_size=batch_size)
-        added_columns.append("bertscore")
+        results["bertscore"] = bertscore.score(
+            sources, hyps, refs,
+            model_type=model,
+            batch_size=batch_size,
+            hyp_lens=tokens["hyp_len"].tolist(),
+            ref_lens=tokens["ref_len"].tolist(),
+        )
+
+    if "comet" in pending and "xcomet" in pending:
+        print("Computing COMET + xCOMET...")
+        from mqmbench.metrics import comet
+        comet_cfg = cfg.metrics.comet
+        xcomet_cfg = cfg.metrics.xcomet
+        scores = comet.score_many(
+            [comet_cfg.model, xcomet_cfg.model], sources, hyps, refs,
+            batch_size=[comet_cfg.batch_size, xcomet_cfg.batch_size],
+            gpus=[comet_cfg.gpus, xcomet_cfg.gpus],
+            half_precision=[
+                getattr(comet_cfg, "half_precision", False),
+                getattr(xcomet_cfg, "half_precision", False),
+            ],
+        )
+        results["comet"] = scores[comet_cfg.model]
+        results["xcomet"] = scores[xcomet_cfg.model]
 
-    if "comet" in metrics_to_run:
+    elif "comet" in pending:
         print("Computing COMET...")
         from mqmbench.metrics import comet
         model = cfg.metrics.comet.model
         batch_size = cfg.metrics.comet.batch_size
         gpus = cfg.metrics.comet.gpus
-        scores_df["comet"] = comet.score(sources, hyps, refs, model_name=model, batch_size=batch_size, gpus=gpus)
-        added_columns.append("comet")
+        half = getattr(cfg.metrics.comet, "half_precision", False)
+        results["comet"] = comet.score(
+            sources, hyps, refs,
+            model_name=model,
+            batch_size=batch_size,
+            gpus=gpus,
+            half_precision=half,
+        )
 
-    if "xcomet" in metrics_to_run:
+    elif "xcomet" in pending:
         print("Computing xCOMET...")
         from mqmbench.metrics import comet
         model = cfg.metrics.xcomet.model
         batch_size = cfg.metrics.xcomet.batch_size
         gpus = cfg.metrics.xcomet.gpus
-        scores_df["xcomet"] = comet.score_xcomet(sources, hyps, refs, model_name=model, batch_size=batch_size, gpus=gpus)
-        added_columns.append("xcomet")
+        half = getattr(cfg.metrics.xcomet, "half_precision", False)
+        results["xcomet"] = comet.score_xcomet(
+            sources, hyps, refs,
+            model_name=model,
+            batch_size=batch_size,
+            gpus=gpus,
+            half_precision=half,
+        )
 
-    if getattr(cfg.metrics, "run_gemba", False):
+    if "gemba" in pending:
+        if {"comet", "xcomet"} & computed:
+            # Free the COMET checkpoints before loading the LLM
+            from mqmbench.metrics import comet
+            comet.release_models()
         print("Computing GEMBA-MQM...")
         from mqmbench.metrics import gemba
         model_name = cfg.metrics.gemba_model
-        raw_penalties = gemba.score(sources, hyps, refs, model_name=model_name)
+        quant = getattr(cfg.metrics, "gemba_quant", "nf4")
+        raw_penalties = gemba.score(
+            sources, hyps, refs, model_name=model_name, quant=quant
+        )
         # Convert to quality score (higher = better) for consistent correlation direction
-        scores_df["gemba"] = [1.0 / (1.0 + p) for p in raw_penalties]
-        added_columns.append("gemba")
+        results["gemba"] = [1.0 / (1.0 + p) for p in raw_penalties]
 
-    return added_columns
+    for m in enabled:
+        scores_df[m] = results[m]
+        if m in computed:
+            pd.DataFrame({m: results[m]}).to_parquet(cache_paths[m], index=False)
+    return enabled
@@ -0,0 +1,73 @@
+"""Unit tests for BERTScore length bucketing, with the scorer stubbed out."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("bert_score")
+
+from mqmbench.metrics import bertscore  # noqa: E402
+
+
+class _F1:
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+
+    def numpy(self):
+        return self.values
+
+
+class _FakeScorer:
+    """Scores "h<i>" as i and records every score() call."""
+
+    calls = []
+
+    def __init__(self, model_type=None, lang=None, batch_size=None):
+        self.model_type = model_type
+
+    def score(self, cands, refs, batch_size):
+        _FakeScorer.calls.append((list(cands), list(refs), batch_size))
+        return None, None, _F1([int(h[1:]) for h in cands])
+
+
+@pytest.fixture
+def fake_scorer(monkeypatch):
+    _FakeScorer.calls = []
+    monkeypatch.setattr(bertscore.bert_score, "BERTScorer", _FakeScorer)
+    return _FakeScorer
+
+
+def _score(n, refs, lens, batch_size):
+    hyps = [f"h{i}" for i in range(n)]
+    return bertscore.score(
+        None, hyps, refs, batch_size=batch_size, hyp_lens=lens, ref_lens=lens
+    )
+
+
+class TestBertScoreBuckets:
+
+    def test_restores_input_order(self, fake_scorer):
+        rng = np.random.default_rng(0)
+        lens = rng.integers(1, 600, 200).tolist()
+        refs = [f"r{i}" for i in range(200)]
+        assert _score(200, refs, lens, batch_size=4) == list(range(200))
+        assert len(fake_scorer.calls) > 1
+
+    def test_reference_stays_in_one_bucket(self, fake_scorer):
+        rng = np.random.default_rng(1)
+        refs = [f"r{i}" for i in rng.integers(0, 30, 300)]
+        lens = rng.integers(1, 512, 300).tolist()
+        assert _score(300, refs, lens, batch_size=2) == list(range(300))
+        buckets_per_ref = {}
+        for k, (_, call_refs, _) in enumerate(fake_scorer.calls):
+            for ref in call_refs:
+                buckets_per_ref.setdefault(ref, set()).add(k)
+        assert all(len(buckets) == 1 for buckets in buckets_per_ref.values())
+
+    def test_min_bucket_size_applies(self, fake_scorer):
+        refs = [f"r{i}" for i in range(20)]
+        _score(20, refs, [512] * 20, batch_size=2)
+        sizes = [len(cands) for cands, _, _ in fake_scorer.calls]
+        assert sizes == [bertscore.MIN_BUCKET_SIZE, bertscore.MIN_BUCKET_SIZE, 4]
+
+    def test_empty_input_returns_empty_list(self, fake_scorer):
+        assert bertscore.score(None, [], []) == []
@@ -0,0 +1,57 @@
+"""Unit tests for the batched sentence-level BLEU implementation."""
+
+import numpy as np
+import pytest
+import sacrebleu
+
+from mqmbench.metrics import bleu
+
+HYPS = [
+    "The cat sat on the mat.",
+    "A dog.",
+    "",
+    "completely unrelated words here",
+    "Hola mundo.",
+    "the the the the the",
+]
+REFS = [
+    "The cat is sitting on the mat.",
+    "A dog barked loudly at the mailman.",
+    "Something.",
+    "nothing in common",
+    "Hola mundo.",
+    "the cat",
+]
+
+
+class TestBleuScore:
+
+    def test_matches_sacrebleu_sentence_bleu(self):
+        result = bleu.score(None, HYPS, REFS)
+        expected = [
+            sacrebleu.sentence_bleu(h, [r]).score / 100.0 for h, r in zip(HYPS, REFS)
+        ]
+        assert result == pytest.approx(expected)
+
+    def test_identical_pair_scores_one(self):
+        result = bleu.score(None, ["Hola mundo."], ["Hola mundo."])
+        assert result == pytest.approx([1.0])
+
+    def test_no_overlap_scores_zero(self):
+        assert bleu.score(None, ["abc def"], ["xyz uvw"]) == [0.0]
+
+    def test_empty_input_returns_empty_list(self):
+        assert bleu.score([], [], []) == []
+
+    def test_pretokenized_input_matches(self):
+        result = bleu.score(
+            None, HYPS, REFS,
+            hyp_tok=bleu.tokenize(HYPS),
+            ref_tok=bleu.tokenize(REFS),
+        )
+        assert result == pytest.approx(bleu.score(None, HYPS, REFS))
+
+    def test_accepts_numpy_object_arrays(self):
+        hyps, refs = np.array(HYPS, dtype=object), np.array(REFS, dtype=object)
+        result = bleu.score(None, hyps, refs)
+        assert result == pytest.approx(bleu.score(None, HYPS, REFS))
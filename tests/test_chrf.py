@@ -0,0 +1,63 @@
+"""Unit tests for the batched sentence-level ChrF++ implementation."""
+
+import numpy as np
+import pytest
+import sacrebleu
+
+from mqmbench.metrics import chrf
+
+HYPS = [
+    "The cat sat on the mat.",
+    "A dog (barked).",
+    "",
+    "completely unrelated words here",
+    "Hola mundo.",
+    "the the the the the",
+]
+REFS = [
+    "The cat is sitting on the mat.",
+    "A dog barked loudly at the mailman.",
+    "Something.",
+    "nothing in common",
+    "Hola mundo.",
+    "the cat",
+]
+
+
+class TestChrfScore:
+
+    def test_matches_sacrebleu_chrf_plus_plus(self):
+        metric = sacrebleu.CHRF(word_order=2)
+        result = chrf.score(None, HYPS, REFS)
+        expected = [
+            metric.sentence_score(h, [r]).score / 100.0 for h, r in zip(HYPS, REFS)
+        ]
+        assert result == pytest.approx(expected)
+
+    def test_identical_pair_scores_one(self):
+        result = chrf.score(None, ["Hola mundo."], ["Hola mundo."])
+        assert result == pytest.approx([1.0])
+
+    def test_repeated_sentence_scores_consistently(self):
+        result = chrf.score(None, ["Hola mundo.", "Hola mundo."], ["Hola.", "Hola."])
+        assert result[0] == pytest.approx(result[1])
+
+    def test_empty_input_returns_empty_list(self):
+        assert chrf.score([], [], []) == []
+
+    def test_accepts_numpy_object_arrays(self):
+        hyps, refs = np.array(HYPS, dtype=object), np.array(REFS, dtype=object)
+        result = chrf.score(None, hyps, refs)
+        assert result == pytest.approx(chrf.score(None, HYPS, REFS))
+
+    def test_large_alphabet_matches_sacrebleu(self):
+        hyp = "".join(chr(0x4E00 + i) for i in range(1100))
+        ref = "".join(chr(0x4E00 + i) for i in range(0, 1100, 2))
+        expected = sacrebleu.CHRF(word_order=2).sentence_score(hyp, [ref]).score / 100.0
+        assert chrf.score(None, [hyp], [ref]) == pytest.approx([expected])
+
+    def test_lone_surrogate_matches_sacrebleu(self):
+        hyp, ref = "The cat sat\ud800 on the mat.", "The cat is sitting on the mat."
+        expected = sacrebleu.CHRF(word_order=2).sentence_score(hyp, [ref]).score / 100.0
+        result = chrf.score(None, [hyp, *HYPS], [ref, *REFS])
+        assert result[0] == pytest.approx(expected)
@@ -0,0 +1,131 @@
+"""Unit tests for per-language metric vs. human correlation analysis."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from mqmbench.analysis.correlation import (
+    correlate_metric_vs_human,
+    run_correlation_analysis,
+    summarize_by_tier,
+)
+
+
+def _make_scores_df(n_per_lang: int = 20, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for lang in ["es", "th", "lo"]:
+        human = rng.integers(0, 5, n_per_lang) / 4.0  # ties, like real MQM scores
+        frames.append(pd.DataFrame({
+            "lang": lang,
+            "quality_score": human,
+            "bleu": human + rng.normal(0, 0.3, n_per_lang),
+            "chrf": rng.random(n_per_lang),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestRunCorrelationAnalysis:
+
+    def test_matches_scipy_per_language(self):
+        df = _make_scores_df()
+        result = run_correlation_analysis(df, ["bleu", "chrf"])
+        assert len(result) == 6
+        for _, row in result.iterrows():
+            group = df[df["lang"] == row["lang"]]
+            pr, pp = stats.pearsonr(group["quality_score"], group[row["metric"]])
+            sr, sp = stats.spearmanr(group["quality_score"], group[row["metric"]])
+            assert row["n"] == len(group)
+            assert row["pearson_r"] == pytest.approx(pr)
+            assert row["pearson_p"] == pytest.approx(pp)
+            assert row["spearman_r"] == pytest.approx(sr)
+            assert row["spearman_p"] == pytest.approx(sp)
+
+    def test_resource_tiers_assigned(self):
+        result = run_correlation_analysis(_make_scores_df(), ["bleu"])
+        tiers = dict(zip(result["lang"], result["resource_tier"]))
+        assert tiers == {"es": "high", "th": "medium", "lo": "low"}
+
+    def test_lang_and_tier_are_categorical(self):
+        result = run_correlation_analysis(_make_scores_df(), ["bleu"])
+        assert isinstance(result["lang"].dtype, pd.CategoricalDtype)
+        assert isinstance(result["resource_tier"].dtype, pd.CategoricalDtype)
+
+    def test_missing_metric_column_skipped(self):
+        result = run_correlation_analysis(_make_scores_df(), ["bleu", "comet"])
+        assert set(result["metric"]) == {"bleu"}
+
+    @pytest.mark.parametrize("metrics", [["bleu"], ["bleu", "chrf"]])
+    def test_single_language(self, metrics):
+        df = _make_scores_df()
+        df = df[df["lang"] == "es"]
+        result = run_correlation_analysis(df, metrics)
+        assert list(result["lang"]) == ["es"] * len(metrics)
+        pr, _ = stats.pearsonr(df["quality_score"], df["bleu"])
+        bleu_row = result[result["metric"] == "bleu"].iloc[0]
+        assert bleu_row["pearson_r"] == pytest.approx(pr)
+
+    def test_missing_values_use_complete_pairs(self):
+        df = _make_scores_df()
+        missing = (df["lang"] == "es") & (df.index % 4 == 0)
+        df.loc[missing, "bleu"] = np.nan
+        result = run_correlation_analysis(df, ["bleu", "chrf"])
+        result = result.set_index(["lang", "metric"])
+        group = df[df["lang"] == "es"].dropna(subset=["bleu"])
+        pr, pp = stats.pearsonr(group["quality_score"], group["bleu"])
+        sr, sp = stats.spearmanr(group["quality_score"], group["bleu"])
+        row = result.loc[("es", "bleu")]
+        assert row["n"] == 15
+        assert row["pearson_r"] == pytest.approx(pr)
+        assert row["pearson_p"] == pytest.approx(pp)
+        assert row["spearman_r"] == pytest.approx(sr)
+        assert row["spearman_p"] == pytest.approx(sp)
+        assert result.loc[("es", "chrf"), "n"] == 20
+
+    def test_small_group_has_no_correlation(self):
+        df = _make_scores_df().groupby("lang").head(2)
+        result = run_correlation_analysis(df, ["bleu"])
+        assert (result["n"] == 2).all()
+        assert result["pearson_r"].isna().all()
+        assert result["spearman_r"].isna().all()
+
+    def test_tier_summary_averages_languages(self):
+        result = run_correlation_analysis(_make_scores_df(), ["bleu"])
+        summary = summarize_by_tier(result)
+        assert set(summary["resource_tier"]) == {"high", "medium", "low"}
+        high = summary[summary["resource_tier"] == "high"]["pearson_r"].iloc[0]
+        es = result[result["lang"] == "es"]["pearson_r"].iloc[0]
+        assert high == pytest.approx(es)
+
+    def test_tier_summary_with_missing_correlations(self):
+        df = _make_scores_df()
+        df = df[(df["lang"] != "es") | (df.index % 20 < 2)]  # es left with 2 segments
+        summary = summarize_by_tier(run_correlation_analysis(df, ["bleu"]))
+        high = summary[summary["resource_tier"] == "high"]
+        assert high["pearson_r"].isna().all()
+        assert summary[summary["resource_tier"] == "low"]["pearson_r"].notna().all()
+
+
+class TestCorrelateMetricVsHuman:
+
+    def test_spearman_matches_scipy_with_ties(self):
+        df = _make_scores_df(n_per_lang=50)
+        human, metric = df["quality_score"].tolist(), df["bleu"].round(1).tolist()
+        result = correlate_metric_vs_human(human, metric, "bleu", "es")
+        sr, sp = stats.spearmanr(human, metric)
+        assert result["spearman_r"] == pytest.approx(sr)
+        assert result["spearman_p"] == pytest.approx(sp)
+
+    def test_perfect_rank_agreement(self):
+        human, metric = [0.1, 0.5, 0.5, 0.9], [1, 2, 2, 3]
+        result = correlate_metric_vs_human(human, metric, "bleu", "es")
+        assert result["spearman_r"] == pytest.approx(1.0)
+
+    def test_accepts_numpy_arrays(self):
+        human, metric = [0.1, 0.5, 0.4, 0.9], [1.0, 2.5, 2.0, 3.0]
+        from_lists = correlate_metric_vs_human(human, metric, "bleu", "es")
+        from_arrays = correlate_metric_vs_human(
+            np.array(human), np.array(metric), "bleu", "es"
+        )
+        assert from_arrays == pytest.approx(from_lists)
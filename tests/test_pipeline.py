@@ -0,0 +1,77 @@
+"""Unit tests for metric score and tokenization caching in the pipeline."""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from mqmbench import pipeline
+from mqmbench.metrics import bleu, chrf
+
+
+def _make_cfg(output_dir) -> SimpleNamespace:
+    return SimpleNamespace(
+        data=SimpleNamespace(output_dir=str(output_dir)),
+        metrics=SimpleNamespace(run=["bleu", "chrf"], n_jobs=1),
+    )
+
+
+def _make_scores_df(hypotheses=None) -> pd.DataFrame:
+    hypotheses = hypotheses or ["The cat sat on the mat.", "A dog barked.", "Hola."]
+    return pd.DataFrame({
+        "source": ["src"] * len(hypotheses),
+        "hypothesis": hypotheses,
+        "reference": ["The cat is on the mat.", "The dog barked.", "Hola mundo."],
+    })
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("expected cached results to be used")
+
+
+class TestRunMetricsCache:
+
+    def test_first_run_writes_cache(self, tmp_path):
+        scores_df = _make_scores_df()
+        columns = pipeline._run_metrics(scores_df, _make_cfg(tmp_path))
+        assert columns == ["bleu", "chrf"]
+        cached = sorted(p.name.split("-")[0] for p in (tmp_path / "cache").iterdir())
+        assert cached == ["bleu", "chrf", "tokens"]
+
+    def test_cache_hit_skips_scoring_and_tokenizing(self, tmp_path, monkeypatch):
+        first = _make_scores_df()
+        pipeline._run_metrics(first, _make_cfg(tmp_path))
+        monkeypatch.setattr(bleu, "tokenize", _fail)
+        monkeypatch.setattr(bleu, "score", _fail)
+        monkeypatch.setattr(chrf, "score", _fail)
+        second = _make_scores_df()
+        pipeline._run_metrics(second, _make_cfg(tmp_path))
+        assert second["bleu"].tolist() == pytest.approx(first["bleu"].tolist())
+        assert second["chrf"].tolist() == pytest.approx(first["chrf"].tolist())
+
+    def test_changed_text_misses_cache(self, tmp_path):
+        first = _make_scores_df()
+        pipeline._run_metrics(first, _make_cfg(tmp_path))
+        hypotheses = ["The cat sat on the mat.", "A dog barked.", "Adiós."]
+        second = _make_scores_df(hypotheses)
+        pipeline._run_metrics(second, _make_cfg(tmp_path))
+        assert second["chrf"].iloc[2] != pytest.approx(first["chrf"].iloc[2])
+        assert len(list((tmp_path / "cache").glob("chrf-*"))) == 2
+
+    def test_no_cache_recomputes(self, tmp_path, monkeypatch):
+        pipeline._run_metrics(_make_scores_df(), _make_cfg(tmp_path))
+        calls = []
+        real_tokenize, real_score = bleu.tokenize, chrf.score
+
+        def tokenize(sentences):
+            calls.append("tokenize")
+            return real_tokenize(sentences)
+
+        def score(*args, **kwargs):
+            calls.append("chrf")
+            return real_score(*args, **kwargs)
+
+        monkeypatch.setattr(bleu, "tokenize", tokenize)
+        monkeypatch.setattr(chrf, "score", score)
+        pipeline._run_metrics(_make_scores_df(), _make_cfg(tmp_path), use_cache=False)
+        assert calls == ["tokenize", "tokenize", "chrf"]